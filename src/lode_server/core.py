@@ -1,7 +1,8 @@
 import threading
+import selectors
 import socket
 
-from queue import Queue
+from collections import deque
 from datetime import datetime
 from abc import ABC, abstractmethod
 from typing import Optional, Iterator
@@ -9,7 +10,11 @@ from dataclasses import dataclass
 from datetime import timezone
 
 
-@dataclass
+KMH_TO_KNOTS = 0.539957     # Speed conversion factor from km/h to knots
+KNOTS_TO_KMH = 1.852        # Speed conversion factor from knots to km/h
+
+
+@dataclass(slots=True)
 class Position:
     """
     Container for position and navigation data with timestamp.
@@ -56,26 +61,62 @@ class NMEAEncoder:
     GGA_GEOID_SEPARATION = '0.0'    # Geoid separation (meters)
     GGA_DGPS_AGE = ''               # Age of DGPS data (empty for no DGPS)
     GGA_DGPS_REF = ''               # DGPS reference station ID
-    
+
+    def __init__(self) -> None:
+        """Precompute sentence skeletons so only variable fields are formatted per call."""
+        # Time and coordinates are formatted straight from their numeric
+        # parts: hhmmss.sss, then degrees, minutes and hemisphere letter
+        self._gga_format = (
+            b"GPGGA,%02d%02d%02d.%03d,%02d%09.6f,%c,%03d%09.6f,%c,"
+            + f"{self.GGA_FIX_QUALITY},{self.GGA_NUM_SATELLITES},{self.GGA_HDOP},".encode('ascii')
+            + b"%.1f"
+            + f",M,{self.GGA_GEOID_SEPARATION},M,{self.GGA_DGPS_AGE},{self.GGA_DGPS_REF}".encode('ascii')
+        )
+        self._rmc_format = b"GPRMC,%02d%02d%02d.%03d,A,%02d%09.6f,%c,%03d%09.6f,%c,%.1f,0.0,%02d%02d%02d,,,A"
+
     @staticmethod
-    def format_coords(lat: float, lon: float) -> tuple[str, str, str, str]:
+    def _coord_fields(lat: float, lon: float) -> tuple[int, float, bytes, int, float, bytes]:
         """
-        Format latitude and longitude for NMEA sentences.
+        Split latitude and longitude into NMEA degree, minute and direction fields.
         Returns:
-            Tuple[str, str, str, str]: (lat_str, lat_dir, lon_str, lon_dir)
+            Tuple: (lat_deg, lat_min, lat_dir, lon_deg, lon_min, lon_dir)
         """
         lat_deg = int(lat)
         lat_min = abs((lat - lat_deg) * 60)
-        lat_dir = 'N' if lat >= 0 else 'S'
-        lat_str = f"{abs(lat_deg):02d}{lat_min:09.6f}"
-
         lon_deg = int(lon)
         lon_min = abs((lon - lon_deg) * 60)
-        lon_dir = 'E' if lon >= 0 else 'W'
-        lon_str = f"{abs(lon_deg):03d}{lon_min:09.6f}"
+        return (
+            abs(lat_deg), lat_min, b'N' if lat >= 0 else b'S',
+            abs(lon_deg), lon_min, b'E' if lon >= 0 else b'W',
+        )
+
+    @staticmethod
+    def format_coords(lat: float, lon: float) -> tuple[str, str, str, str]:
+        """
+        Format latitude and longitude for NMEA sentences.
+        Returns:
+            Tuple[str, str, str, str]: (lat_str, lat_dir, lon_str, lon_dir)
+        """
+        lat_deg, lat_min, lat_dir, lon_deg, lon_min, lon_dir = NMEAEncoder._coord_fields(lat, lon)
+        return (
+            f"{lat_deg:02d}{lat_min:09.6f}", lat_dir.decode('ascii'),
+            f"{lon_deg:03d}{lon_min:09.6f}", lon_dir.decode('ascii'),
+        )
+
+    @staticmethod
+    def _xor_bytes(data: bytes) -> int:
+        """
+        XOR all bytes of a buffer together.
+        Args:
+            data (bytes): The sentence body.
+        Returns:
+            int: The checksum value (0-255).
+        """
+        checksum = 0
+        for byte in data:
+            checksum ^= byte
+        return checksum
 
-        return lat_str, lat_dir, lon_str, lon_dir
-    
     @staticmethod
     def calculate_checksum(sentence: str) -> str:
         """
@@ -85,45 +126,65 @@ class NMEAEncoder:
         Returns:
             str: The checksum as a two-digit hexadecimal string.
         """
-        checksum = 0
-        for char in sentence:
-            checksum ^= ord(char)
-        return f"{checksum:02X}"
-    
+        return f"{NMEAEncoder._xor_bytes(sentence.encode('ascii')):02X}"
+
+    def _frame(self, body: bytes) -> bytes:
+        """Wrap a sentence body with '$', checksum and line terminator."""
+        return b"$%s*%02X\r\n" % (body, self._xor_bytes(body))
+
+    @staticmethod
+    def _clock_fields(dt: datetime) -> tuple[int, int, int, int]:
+        """
+        Split a timestamp into NMEA hhmmss.sss fields.
+        Returns:
+            Tuple: (hour, minute, second, millisecond)
+        """
+        return dt.hour, dt.minute, dt.second, dt.microsecond // 1000
+
+    def _encode_gga(self, data: Position, clock: tuple[int, int, int, int],
+                    coords: tuple[int, float, bytes, int, float, bytes]) -> bytes:
+        """Build a framed GGA sentence as ASCII bytes from precomputed time and coordinate fields."""
+        return self._frame(self._gga_format % (*clock, *coords, data.elevation))
+
+    def _encode_rmc(self, data: Position, clock: tuple[int, int, int, int],
+                    coords: tuple[int, float, bytes, int, float, bytes]) -> bytes:
+        """Build a framed RMC sentence as ASCII bytes from precomputed time and coordinate fields."""
+        dt = data.time
+        speed_knots = data.speed * KMH_TO_KNOTS
+        return self._frame(self._rmc_format % (
+            *clock, *coords, speed_knots, dt.day, dt.month, dt.year % 100
+        ))
+
     def encode_gga(self, data: Position) -> str:
         """
         Generate an NMEA GGA sentence from position data.
         Returns:
             str: The generated GGA sentence
         """
-        time_str = data.time.strftime("%H%M%S.%f")[:-3]
-        lat_str, lat_dir, lon_str, lon_dir = self.format_coords(data.lat, data.lon)
-
-        gga = (
-            f"GPGGA,{time_str},{lat_str},{lat_dir},"
-            f"{lon_str},{lon_dir},{self.GGA_FIX_QUALITY},{self.GGA_NUM_SATELLITES},"
-            f"{self.GGA_HDOP},{data.elevation:.1f},M,{self.GGA_GEOID_SEPARATION},M,"
-            f"{self.GGA_DGPS_AGE},{self.GGA_DGPS_REF}"
-        )
-        return f"${gga}*{self.calculate_checksum(gga)}\r\n"
-    
+        clock = self._clock_fields(data.time)
+        coords = self._coord_fields(data.lat, data.lon)
+        return self._encode_gga(data, clock, coords).decode('ascii')
+
     def encode_rmc(self, data: Position) -> str:
         """
         Generate an NMEA RMC sentence from position data.
         Returns:
             str: The generated RMC sentence
         """
-        time_str = data.time.strftime("%H%M%S.%f")[:-3]
-        date_str = data.time.strftime("%d%m%y")
-        lat_str, lat_dir, lon_str, lon_dir = self.format_coords(data.lat, data.lon)
-
-        speed_knots = data.speed * 0.539957  # Convert speed from km/h to knots
+        clock = self._clock_fields(data.time)
+        coords = self._coord_fields(data.lat, data.lon)
+        return self._encode_rmc(data, clock, coords).decode('ascii')
 
-        rmc = (
-            f"GPRMC,{time_str},A,{lat_str},{lat_dir},"
-            f"{lon_str},{lon_dir},{speed_knots:.1f},0.0,{date_str},,,A"
-        )
-        return f"${rmc}*{self.calculate_checksum(rmc)}\r\n"
+    def encode(self, data: Position) -> bytes:
+        """
+        Generate the RMC and GGA sentences for a position as a single payload.
+        Time and coordinate fields are computed once and shared by both sentences.
+        Returns:
+            bytes: ASCII-encoded RMC sentence followed by the GGA sentence
+        """
+        clock = self._clock_fields(data.time)
+        coords = self._coord_fields(data.lat, data.lon)
+        return self._encode_rmc(data, clock, coords) + self._encode_gga(data, clock, coords)
 
 
 class NMEADecoder:
@@ -135,37 +196,47 @@ class NMEADecoder:
     def decode(nmea: str) -> Optional[Position]:
         if not nmea.startswith('$'):
             raise ValueError("Not a valid NMEA sentence")
-        nmea = nmea.strip()
-        if '*' in nmea:
-            nmea = nmea[:nmea.index('*')]
-        fields = nmea[1:].split(',')
-
-        if fields[0] == 'GPRMC' or fields[0] == 'RMC' or fields[0] == 'GNRMC':
-            if len(fields) < 10 or fields[2] != 'A':
-                raise ValueError("Invalid RMC sentence")
-            time_str = fields[1]
-            date_str = fields[9]
-            lat = NMEADecoder._parse_lat(fields[3], fields[4])
-            lon = NMEADecoder._parse_lon(fields[5], fields[6])
-            speed = float(fields[7]) * 1.852 if fields[7] else 0.0  # knots to km/h
-            elevation = 0.0  # Not present in RMC
-            dt = NMEADecoder._parse_datetime(time_str, date_str)
-            if dt is None:
-                raise ValueError("No valid datetime in RMC")
-            return Position(0, lat, lon, speed, elevation, dt)
-        elif fields[0] == 'GPGGA' or fields[0] == 'GGA' or fields[0] == 'GNGGA':
-            if len(fields) < 10:
-                raise ValueError("Invalid GGA sentence")
-            time_str = fields[1]
-            lat = NMEADecoder._parse_lat(fields[2], fields[3])
-            lon = NMEADecoder._parse_lon(fields[4], fields[5])
-            elevation = float(fields[9]) if fields[9] else 0.0
-            speed = 0.0  # Not present in GGA
-            dt = NMEADecoder._parse_datetime(time_str)
-            if dt is None:
-                raise ValueError("No valid datetime in GGA")
-            return Position(0, lat, lon, speed, elevation, dt)
-        raise ValueError("Unsupported NMEA sentence type")
+        fields = nmea.strip()[1:].partition('*')[0].split(',')
+        decoder = NMEADecoder._DECODERS.get(fields[0])
+        if decoder is None:
+            raise ValueError("Unsupported NMEA sentence type")
+        return decoder(fields)
+
+    @staticmethod
+    def _decode_rmc(fields: list[str]) -> Position:
+        if len(fields) < 10 or fields[2] != 'A':
+            raise ValueError("Invalid RMC sentence")
+        lat = NMEADecoder._parse_lat(fields[3], fields[4])
+        lon = NMEADecoder._parse_lon(fields[5], fields[6])
+        speed = float(fields[7]) * KNOTS_TO_KMH if fields[7] else 0.0
+        elevation = 0.0  # Not present in RMC
+        dt = NMEADecoder._parse_datetime(fields[1], fields[9])
+        if dt is None:
+            raise ValueError("No valid datetime in RMC")
+        return Position(0, lat, lon, speed, elevation, dt)
+
+    @staticmethod
+    def _decode_gga(fields: list[str]) -> Position:
+        if len(fields) < 10:
+            raise ValueError("Invalid GGA sentence")
+        lat = NMEADecoder._parse_lat(fields[2], fields[3])
+        lon = NMEADecoder._parse_lon(fields[4], fields[5])
+        elevation = float(fields[9]) if fields[9] else 0.0
+        speed = 0.0  # Not present in GGA
+        dt = NMEADecoder._parse_datetime(fields[1])
+        if dt is None:
+            raise ValueError("No valid datetime in GGA")
+        return Position(0, lat, lon, speed, elevation, dt)
+
+    # Sentence type -> decoder, resolved with a single dict lookup
+    _DECODERS = {
+        'GPRMC': _decode_rmc,
+        'RMC': _decode_rmc,
+        'GNRMC': _decode_rmc,
+        'GPGGA': _decode_gga,
+        'GGA': _decode_gga,
+        'GNGGA': _decode_gga,
+    }
 
     @staticmethod
     def _parse_lat(lat_str, ns):
@@ -197,7 +268,8 @@ class NMEADecoder:
             hour = int(time_str[0:2])
             minute = int(time_str[2:4])
             second = int(time_str[4:6])
-            microsecond = int(float('0.' + time_str.split('.')[1]) * 1e6) if '.' in time_str else 0
+            fraction = time_str.partition('.')[2]
+            microsecond = int((fraction + '000000')[:6])
             if date_str:
                 day = int(date_str[0:2])
                 month = int(date_str[2:4])
@@ -246,9 +318,13 @@ class LodeGenerator(ABC, Iterator):
     
 
 class FileGenerator(LodeGenerator):
-
-    _positions: list[Position] = []
-    _index: int = 0
+    """
+    Base class for generators that play back positions loaded from a file.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self._positions: list[Position] = []
+        self._index: int = 0
 
     def _update_position(self) -> Optional[Position]:
         """
@@ -265,29 +341,85 @@ class FileGenerator(LodeGenerator):
 
 class ClientThread(threading.Thread):
     """Thread for handling client connections and broadcasting data."""
-    
+
+    SEND_BUFFER_SIZE = 1 << 20  # Per-client socket send buffer in bytes
+    MAX_BACKLOG = 1 << 16       # Unsent bytes allowed per client before it is dropped
+    LISTEN_BACKLOG = socket.SOMAXCONN   # Pending connections queued by the kernel
+
     def __init__(self, port: int):
         super().__init__(daemon=True)
         self._port = port
-        self._clients = []
-        self._data_queue = Queue()
+        self._clients: tuple[socket.socket, ...] = ()  # Replaced, never mutated
+        self._backlog: dict[socket.socket, bytearray] = {}  # Unsent data of slow clients
+        self._pending = deque()  # Payloads waiting to be broadcast, in order
         self._running = True
         self._lock = threading.Lock()
         self._server_socket = None
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._wakeup_send.setblocking(False)
 
-    def _broadcast(self, rmc: str, gga: str) -> None:
-        """Send data to all connected clients."""
-        with self._lock:
-            for conn in self._clients[:]:
+    def _broadcast(self, payload: bytes) -> None:
+        """
+        Send data to all connected clients without blocking.
+
+        Whatever a client's socket does not accept is kept in its backlog and
+        flushed when the socket becomes writable, so a slow client never
+        delays the others.
+        """
+        dead = set()
+        for conn in self._clients:
+            backlog = self._backlog.get(conn)
+            if backlog is not None:
+                # Keep ordering behind data that is still waiting
+                if len(backlog) + len(payload) > self.MAX_BACKLOG:
+                    dead.add(conn)
+                else:
+                    backlog += payload
+                continue
+            try:
+                sent = conn.send(payload)
+            except (BlockingIOError, InterruptedError):
+                sent = 0
+            except Exception:
+                dead.add(conn)
+                continue
+            if sent < len(payload):
+                self._backlog[conn] = bytearray(memoryview(payload)[sent:])
+                self._selector.register(conn, selectors.EVENT_WRITE)
+        if dead:
+            self._drop(dead)
+
+    def _flush(self, conn: socket.socket) -> None:
+        """Send as much of a client's backlog as its socket accepts."""
+        backlog = self._backlog[conn]
+        try:
+            sent = conn.send(backlog)
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception:
+            self._drop({conn})
+            return
+        del backlog[:sent]
+        if not backlog:
+            del self._backlog[conn]
+            self._selector.unregister(conn)
+
+    def _drop(self, dead: set[socket.socket]) -> None:
+        """Close and forget failed or stalled clients."""
+        for conn in dead:
+            if self._backlog.pop(conn, None) is not None:
                 try:
-                    conn.sendall(rmc.encode('ascii'))
-                    conn.sendall(gga.encode('ascii'))
+                    self._selector.unregister(conn)
                 except Exception:
-                    try:
-                        conn.close()
-                    except Exception:
-                        pass
-                    self._clients.remove(conn)
+                    pass
+            try:
+                conn.close()
+            except Exception:
+                pass
+        with self._lock:
+            self._clients = tuple(c for c in self._clients if c not in dead)
 
     def _cleanup(self) -> None:
         """Clean up resources."""
@@ -297,49 +429,110 @@ class ClientThread(threading.Thread):
                     conn.close()
                 except Exception:
                     pass
-            self._clients.clear()
-        
-        if self.server_socket:
+            self._clients = ()
+            self._backlog.clear()
+
+        if self._server_socket:
             try:
-                self.server_socket.close()
+                self._server_socket.close()
+            except Exception:
+                pass
+
+        for resource in (self._selector, self._wakeup_recv, self._wakeup_send):
+            try:
+                resource.close()
             except Exception:
                 pass
 
     def run(self) -> None:
         """Main thread loop for accepting clients and broadcasting data."""
         try:
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.server_socket.bind(('0.0.0.0', self._port))
-            self.server_socket.listen(5)
-            self.server_socket.settimeout(1)
+            self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._server_socket.bind(('0.0.0.0', self._port))
+            self._server_socket.listen(self.LISTEN_BACKLOG)
+            self._server_socket.setblocking(False)
+
+            self._selector.register(self._server_socket, selectors.EVENT_READ)
+            self._selector.register(self._wakeup_recv, selectors.EVENT_READ)
 
             while self._running:
                 try:
-                    # Accept new clients
-                    try:
-                        conn, addr = self.server_socket.accept()
-                        with self._lock:
-                            self._clients.append(conn)
-                    except socket.timeout:
-                        pass
-
-                    # Process data from queue
-                    while not self._data_queue.empty():
-                        rmc, gga = self._data_queue.get()
-                        self._broadcast(rmc, gga)
+                    # Wait for new clients, a wake-up from add_data or
+                    # writable clients with a backlog
+                    for key, _ in self._selector.select(timeout=1):
+                        if key.fileobj is self._server_socket:
+                            self._accept()
+                        elif key.fileobj is self._wakeup_recv:
+                            self._drain_wakeup()
+                        else:
+                            self._flush(key.fileobj)
+
+                    # Send every pending payload, oldest first
+                    pending = self._pending
+                    while pending:
+                        self._broadcast(pending.popleft())
 
                 except Exception as e:
                     if self._running:
                         pass  # Silent error handling
+        except Exception:
+            # stop() may release the selector while the thread is starting
+            if self._running:
+                raise
         finally:
             self._cleanup()
 
-    def add_data(self, rmc: str, gga: str) -> None:
-        """Add data to the broadcast queue."""
-        self._data_queue.put((rmc, gga))
+    def _accept(self) -> None:
+        """Accept all pending client connections."""
+        while True:
+            try:
+                conn, addr = self._server_socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            # Clients are only written to, so they are registered with the
+            # selector only for EVENT_WRITE while they have a backlog, never
+            # for reads, to avoid wake-ups on readable or half-closed sockets.
+            conn.setblocking(False)
+            self._configure_client(conn)
+            with self._lock:
+                self._clients += (conn,)
+
+    def _configure_client(self, conn: socket.socket) -> None:
+        """Disable Nagle's algorithm and enlarge the send buffer of a client socket."""
+        try:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SEND_BUFFER_SIZE)
+        except OSError:
+            pass
+
+    def _drain_wakeup(self) -> None:
+        """Discard pending wake-up bytes."""
+        try:
+            while self._wakeup_recv.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+    def _wakeup(self) -> None:
+        """Interrupt the selector wait so queued data is sent immediately."""
+        try:
+            self._wakeup_send.send(b'\0')
+        except OSError:
+            pass
+
+    def add_data(self, payload: bytes) -> None:
+        """
+        Publish encoded sentences for broadcasting.
+
+        Payloads are queued and sent in order, so no route point is lost
+        when several are published between two wake-ups.
+        """
+        self._pending.append(payload)
+        self._wakeup()
 
     def stop(self) -> None:
         """Stop the thread gracefully."""
         self._running = False
+        self._wakeup()
         self._cleanup()
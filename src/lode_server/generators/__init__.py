@@ -71,13 +71,8 @@ def load_generators():
         root_package = __name__.split('.')[0]
         plugin_group = f"{root_package}.generators"
         
-        eps = entry_points()
-        if hasattr(eps, 'select'):  # Python 3.10+
-            plugins = eps.select(group=plugin_group)
-        else:
-            plugins = eps.get(plugin_group, [])
-        
-        for ep in plugins:
+        # Use the entry point selection API to query the plugin group
+        for ep in entry_points(group=plugin_group):
             generator_class = ep.load()
             _generators[ep.name] = generator_class
     except ImportError:
@@ -35,6 +35,7 @@ class CSVGenerator(FileGenerator):
             with open(filename, 'r', newline='') as f:
                 reader = csv.reader(f)
                 index = 1
+                now = datetime.now(timezone.utc)  # Load time shared by all points
                 for row in reader:
                     # Skip empty or comment lines
                     if not row or row[0].startswith('#'):
@@ -60,7 +61,7 @@ class CSVGenerator(FileGenerator):
                         lon=lon,
                         speed=speed,
                         elevation=elevation,
-                        time=datetime.now(timezone.utc),
+                        time=now,
                         duration=duration,
                         transition=transition,
                         description=description
@@ -6,6 +6,10 @@ from lode_server.core import LodeGenerator, Position
 from lode_server.generators import register_generator
 
 
+_DEG_TO_RAD = math.pi / 180.0   # Same factors math.radians/math.degrees use
+_RAD_TO_DEG = 180.0 / math.pi
+
+
 @register_generator("dynamic")
 class DynamicGenerator(LodeGenerator):
     """
@@ -14,59 +18,80 @@ class DynamicGenerator(LodeGenerator):
     """
     _EARTH_RADIUS_KM = 6371.0   # Earth's mean radius in km
 
-    _index: int = 0
-    _speed: float = 10.0        # km/h
-    _angle: float = 0.0         # current angle in circular motion
-    _duration: float = 1.0
-    _transition: str = "auto"
-    _radius: float = 0.1        # radius of circular path in km
-    _center_lat: float = 0.0    # Will be calculated
-    _center_lon: float = 0.0    # Will be calculated
+    # Optional name=value parameters: name -> (attribute, converter)
+    _OPTIONS = {
+        "speed": ("_speed", float),
+        "duration": ("_duration", float),
+        "transition": ("_transition", str),
+        "radius": ("_radius", float),
+    }
 
     def __init__(self, *args) -> None:
         super().__init__()
+        self._index: int = 0
+        self._speed: float = 10.0        # km/h
+        self._angle: float = 0.0         # current angle in circular motion
+        self._duration: float = 1.0
+        self._transition: str = "auto"
+        self._radius: float = 0.1        # radius of circular path in km
+        self._angle_increment: float = 0.0   # angle travelled per point, in radians
+        self._center_lat: float = 0.0    # Will be calculated
+        self._center_lon: float = 0.0    # Will be calculated
+        self._center_lon_rad: float = 0.0        # Cached circle terms, see _calculate_center
+        self._sin_center_lat: float = 0.0
+        self._cos_center_lat: float = 1.0
+        self._sin_angular_radius: float = 0.0
+        self._cos_angular_radius: float = 1.0
+
         if len(args) < 2:
             raise ValueError("For generate method you must specify lat and lon")
 
         for param in args[2:]:
-            if isinstance(param, str) and param.startswith("speed="):
-                try:
-                    self._speed = float(param.split("=", 1)[1])
-                except Exception:
-                    raise ValueError("Invalid speed value")
-            elif isinstance(param, str) and param.startswith("duration="):
-                try:
-                    self._duration = float(param.split("=", 1)[1])
-                except Exception:
-                    raise ValueError("Invalid duration value")
-            elif isinstance(param, str) and param.startswith("transition="):
-                self._transition = param.split("=", 1)[1]
-            elif isinstance(param, str) and param.startswith("radius="):
-                try:
-                    self._radius = float(param.split("=", 1)[1])
-                except Exception:
-                    raise ValueError("Invalid radius value")
+            if not isinstance(param, str):
+                continue
+            name, sep, value = param.partition("=")
+            option = self._OPTIONS.get(name) if sep else None
+            if option is None:
+                continue
+            attr, convert = option
+            try:
+                setattr(self, attr, convert(value))
+            except Exception:
+                raise ValueError(f"Invalid {name} value")
         # Calculate center point so that initial point is on the circle
         self._calculate_center(float(args[0]), float(args[1]))
 
+        # Calculate angular speed based on circumference and speed
+        circumference = 2 * math.pi * self._radius
+        if circumference > 0:
+            self._angle_increment = (self._speed * self._duration / 3600) / circumference * 2 * math.pi
+
 
     def _calculate_center(self, initial_lat: float, initial_lon: float):
         """Calculate center point so that initial point is at angle 0 on the circle"""
         # Move from initial point at 180 degrees (south) to find center
         angular_dist = self._radius / self._EARTH_RADIUS_KM
-        initial_lat_rad = math.radians(initial_lat)
-        initial_lon_rad = math.radians(initial_lon)
+        initial_lat_rad = initial_lat * _DEG_TO_RAD
+        initial_lon_rad = initial_lon * _DEG_TO_RAD
 
         # Calculate center point (180 degrees from initial point)
-        self._center_lat = math.degrees(math.asin(
+        self._center_lat = math.asin(
             math.sin(initial_lat_rad) * math.cos(angular_dist) -
             math.cos(initial_lat_rad) * math.sin(angular_dist) * math.cos(math.pi)
-        ))
+        ) * _RAD_TO_DEG
 
-        self._center_lon = math.degrees(initial_lon_rad + math.atan2(
+        self._center_lon = (initial_lon_rad + math.atan2(
             math.sin(math.pi) * math.sin(angular_dist) * math.cos(initial_lat_rad),
-            math.cos(angular_dist) + math.sin(initial_lat_rad) * math.sin(math.radians(self._center_lat))
-        ))
+            math.cos(angular_dist) + math.sin(initial_lat_rad) * math.sin(self._center_lat * _DEG_TO_RAD)
+        )) * _RAD_TO_DEG
+
+        # Terms of the circle formula that do not depend on the angle
+        center_lat_rad = self._center_lat * _DEG_TO_RAD
+        self._center_lon_rad = self._center_lon * _DEG_TO_RAD
+        self._sin_center_lat = math.sin(center_lat_rad)
+        self._cos_center_lat = math.cos(center_lat_rad)
+        self._sin_angular_radius = math.sin(angular_dist)
+        self._cos_angular_radius = math.cos(angular_dist)
 
     def _calculate_position_on_circle(self, angle: float) -> tuple[float, float]:
         """
@@ -78,21 +103,17 @@ class DynamicGenerator(LodeGenerator):
         Returns:
             Tuple[new_lat, new_lon] in degrees
         """
-        angular_radius = self._radius / self._EARTH_RADIUS_KM
-        center_lat_rad = math.radians(self._center_lat)
-        center_lon_rad = math.radians(self._center_lon)
-
         new_lat_rad = math.asin(
-            math.sin(center_lat_rad) * math.cos(angular_radius) +
-            math.cos(center_lat_rad) * math.sin(angular_radius) * math.cos(angle)
+            self._sin_center_lat * self._cos_angular_radius +
+            self._cos_center_lat * self._sin_angular_radius * math.cos(angle)
         )
 
-        new_lon_rad = center_lon_rad + math.atan2(
-            math.sin(angle) * math.sin(angular_radius) * math.cos(center_lat_rad),
-            math.cos(angular_radius) - math.sin(center_lat_rad) * math.sin(new_lat_rad)
+        new_lon_rad = self._center_lon_rad + math.atan2(
+            math.sin(angle) * self._sin_angular_radius * self._cos_center_lat,
+            self._cos_angular_radius - self._sin_center_lat * math.sin(new_lat_rad)
         )
 
-        return math.degrees(new_lat_rad), math.degrees(new_lon_rad)
+        return new_lat_rad * _RAD_TO_DEG, new_lon_rad * _RAD_TO_DEG
 
     def _update_position(self) -> Optional[Position]:
         """
@@ -100,14 +121,7 @@ class DynamicGenerator(LodeGenerator):
         Returns:
             Optional[Position]: Position data, None if finished
         """
-        # Calculate angular speed based on circumference and speed
-        circumference = 2 * math.pi * self._radius
-        if circumference > 0:
-            angle_increment = (self._speed * self._duration / 3600) / circumference * 2 * math.pi
-        else:
-            angle_increment = 0
-
-        self._angle = (self._angle + angle_increment) % (2 * math.pi)
+        self._angle = (self._angle + self._angle_increment) % (2 * math.pi)
 
         lat, lon = self._calculate_position_on_circle(self._angle)
 
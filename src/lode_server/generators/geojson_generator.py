@@ -32,6 +32,7 @@ class GeoJSONGenerator(FileGenerator):
                 raise ValueError("GeoJSON file must contain 'features'")
             
             index = 1
+            now = datetime.now(timezone.utc)  # Load time shared by all points
             
             for feature in route_data['features']:
                 if feature['geometry']['type'] != 'Point':
@@ -46,7 +47,7 @@ class GeoJSONGenerator(FileGenerator):
                     lon=coords[0],
                     speed=float(props.get('speed', 0)),
                     elevation=float(props.get('elevation', 0)),
-                    time=datetime.now(timezone.utc),
+                    time=now,
                     duration=float(props.get('duration', 0)),
                     transition=props.get('transition', 'auto'),
                     description=props.get('description', '')
@@ -11,6 +11,7 @@ class NMEAGenerator(FileGenerator):
     """
     def __init__(self, *args) -> None:
         super().__init__()
+        self._duration: float = 1.0
         if len(args) < 1:
             raise ValueError("NMEA file path must be specified")
 
@@ -1,3 +1,4 @@
+import sys
 import time
 
 from typing import Any
@@ -6,6 +7,20 @@ from lode_server.generators import get_generator
 from lode_server.core import Position, NMEAEncoder, LodeGenerator, ClientThread
 
 
+# Console output templates with labels padded once at import time, one for
+# points with a description and one for points without
+_OUTPUT_FORMAT = (
+    f"{'Point, #:':>15}\t%(index)s\n"
+    f"{'Latitude, deg:':>15}\t%(lat)-12.6f\n"
+    f"{'Longitude, deg:':>15}\t%(lon)-12.6f\n"
+    f"{'Speed, km/h:':>15}\t%(speed)-12.2f\n"
+    f"{'Elevation, m:':>15}\t%(elevation)-12.2f\n"
+    f"{'Time:':>15}\t%(time)s\n"
+)
+_OUTPUT_FORMAT_DESCRIPTION = _OUTPUT_FORMAT + f"{'Description:':>15}\t%(description)s\n\n"
+_OUTPUT_FORMAT_NO_DESCRIPTION = _OUTPUT_FORMAT + f"{'':>15}\t{'':<12}\n\n"
+
+
 class LodeServer:
     """Main server class handling client connections and data broadcasting."""
     
@@ -48,26 +63,27 @@ class LodeServer:
         Args:
             data: Position object with navigation data
         """
-        description = f"{'Description:':>15}\t{data.description}\n" if data.description else f"{'':>15}\t{'':<12}\n"
-        output = (
-            f"{'Point, #:':>15}\t{data.index}\n"
-            f"{'Latitude, deg:':>15}\t{data.lat:<12.6f}\n"
-            f"{'Longitude, deg:':>15}\t{data.lon:<12.6f}\n"
-            f"{'Speed, km/h:':>15}\t{data.speed:<12.2f}\n"
-            f"{'Elevation, m:':>15}\t{data.elevation:<12.2f}\n"
-            f"{'Time:':>15}\t{data.time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            f"{description}"
-        )
-        print(output)
+        template = _OUTPUT_FORMAT_DESCRIPTION if data.description else _OUTPUT_FORMAT_NO_DESCRIPTION
+        output = template % {
+            'index': data.index,
+            'lat': data.lat,
+            'lon': data.lon,
+            'speed': data.speed,
+            'elevation': data.elevation,
+            'time': data.time.strftime('%Y-%m-%d %H:%M:%S'),
+            'description': data.description,
+        }
+        sys.stdout.write(output)
+        sys.stdout.flush()
 
     def run(self) -> None:
         """Start the Lode TCP server and begin data transmission."""
         try:
             # Start client handler thread
-            self.client_handler = ClientThread(self._port)
-            self.client_handler.start()
+            self._client_handler = ClientThread(self._port)
+            self._client_handler.start()
 
-            self.generator = self._create_generator(self._source, *self._params)
+            self._generator = self._create_generator(self._source, *self._params)
 
             print(f"\nLode TCP Server started on port {self._port}")
             print("=" * 40)
@@ -84,26 +100,37 @@ class LodeServer:
             print("Press Ctrl+C to stop the server\n")
 
             print("\n" * 1)
+            # Bind per-tick callables to locals to skip attribute lookups
+            perf_counter = time.perf_counter
+            sleep = time.sleep
+            next_position = self._generator.__next__
+            print_data = self._print_data
+            encode = self._encoder.encode
+            add_data = self._client_handler.add_data
+
+            # Absolute deadline of the next point, so processing time and
+            # sleep overshoot do not accumulate as drift
+            next_tick = perf_counter()
             while True:
                 try:
-                    last_time = time.perf_counter()
-                    data = next(self.generator)
+                    data = next_position()
 
-                    self._print_data(data)
+                    print_data(data)
 
-                    rmc = self._encoder.encode_rmc(data)
-                    gga = self._encoder.encode_gga(data)
-                    self.client_handler.add_data(rmc, gga)
+                    add_data(encode(data))
 
-                    current_time = time.perf_counter()
-                    elapsed = current_time - last_time
-                    remaining_time = data.duration - elapsed
+                    next_tick += data.duration
+                    remaining_time = next_tick - perf_counter()
 
-                    if remaining_time > 0.001:
-                        time.sleep(remaining_time)
+                    if remaining_time > 0:
+                        sleep(remaining_time)
+                    else:
+                        # Behind schedule: restart from now instead of bursting
+                        next_tick -= remaining_time
                     if data.transition == "manual":
                         print("Press ENTER to proceed to the next point", end="", flush=True)
                         input()
+                        next_tick = perf_counter()
 
                 except KeyboardInterrupt:
                     break
@@ -116,9 +143,9 @@ class LodeServer:
             print(f"Server initialization error: {str(e)}")
         finally:
             print("\nServer stopped gracefully")
-            if self.client_handler:
-                self.client_handler.stop()
-                self.client_handler.join(timeout=1)
+            if self._client_handler:
+                self._client_handler.stop()
+                self._client_handler.join(timeout=1)
 
 
 def run_server(